@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+import functools
+import os
+import sys
+import time
+
+from lib import (
+  tuxapp,
+)
+
+def execute_code(code):
+  exec(code, {'__file__': get_script_path(), '__name__': 'benchmark'}) # pylint: disable=exec-used
+  return True
+
+def measure_time(function, number=3):
+  timings = []
+  for _ in range(number):
+    timestamp = time.time()
+    function()
+    timings.append(time.time() - timestamp)
+  return min(timings)
+
+def run_script(arguments):
+  import subprocess
+  with open(os.devnull, 'w') as file:
+    subprocess.call((sys.executable, get_script_path()) + arguments, stdout=file, stderr=file)
+  return True
+
+def unpack_temporarily(function, path, **overrides):
+  import shutil
+  import tempfile
+  output_path = tempfile.mkdtemp()
+  originals = dict((name, getattr(tuxapp, name)) for name in overrides)
+  for name, value in overrides.items():
+    setattr(tuxapp, name, value)
+  try:
+    return tuxapp.silence(function)(path, output_path)
+  finally:
+    for name, value in originals.items():
+      setattr(tuxapp, name, value)
+    shutil.rmtree(output_path)
+
+benchmark = lambda name, arguments=(): \
+  tuxapp.check('Unknown benchmark: {}'.format(name))(lambda: name in get_benchmarks())() and \
+  get_benchmarks()[name](*arguments)
+
+benchmark_package_list = lambda path, url='https://deb.debian.org/debian/dists/stable/main/binary-amd64/Packages.xz': \
+  print_timing('xzgrep', lambda: sum(1 for _ in tuxapp.parse_package_list_items(tuxapp.read_package_list_lines_xzgrep(path, url)))) and \
+  (not tuxapp.is_module_available('lzma') or print_timing('lzma', lambda: sum(1 for _ in tuxapp.parse_package_list_items(tuxapp.read_package_list_lines_lzma(path, url)))))
+
+benchmark_package_resolver = lambda app, *packages: \
+  print_timing('resolve', lambda: tuxapp.resolve_app_package_urls(app, packages or tuxapp.get_installed_app_packages(app)))
+
+benchmark_package_unpack = lambda path: \
+  print_timing('tar', lambda: unpack_temporarily(tuxapp.unpack_package, path, is_package_data_extractable=lambda path: False, find_parallel_decompressor=lambda extension: None), os.path.getsize(path)) and \
+  print_timing('tarfile', lambda: unpack_temporarily(tuxapp.unpack_package, path, is_package_data_parallelizable=lambda path: False), os.path.getsize(path)) and \
+  all(print_timing(command, lambda: unpack_temporarily(tuxapp.unpack_package, path, is_package_data_extractable=lambda path: False, find_parallel_decompressor=lambda extension: command), os.path.getsize(path)) for command in get_available_decompressors(tuxapp.query_package_data_header(path, 'extension')))
+
+benchmark_startup = lambda *arguments: \
+  print_timing('compile', compile_script) and \
+  print_timing('exec', functools.partial(execute_code, compile_script())) and \
+  print_timing(' '.join(arguments or ('-l',)), lambda: run_script(arguments or ('-l',)))
+
+benchmark_tarball_unpack = lambda path: \
+  print_timing('tar', lambda: unpack_temporarily(tuxapp.unpack_tarball, path, find_parallel_decompressor=lambda extension: None), os.path.getsize(path)) and \
+  all(print_timing(command, lambda: unpack_temporarily(tuxapp.unpack_tarball, path, find_parallel_decompressor=lambda extension: command), os.path.getsize(path)) for command in get_available_decompressors(tuxapp.get_tarball_compression(path)))
+
+compile_script = lambda: compile(tuxapp.read_file_binary(get_script_path()), get_script_path(), 'exec')
+
+get_available_decompressors = lambda extension: tuple(command for command in tuxapp.get_parallel_decompressors().get(extension, ()) if tuxapp.is_existing_command(command.split()[0]))
+
+get_benchmarks = lambda: {
+  'package-list': benchmark_package_list,
+  'package-resolver': benchmark_package_resolver,
+  'package-unpack': benchmark_package_unpack,
+  'startup': benchmark_startup,
+  'tarball-unpack': benchmark_tarball_unpack,
+}
+
+get_script_path = lambda: os.path.join(tuxapp.get_project_path(), 'tuxapp')
+
+print_timing = lambda name, function, size=0: \
+  print_timing_result(name, measure_time(function), size)
+
+print_timing_result = lambda name, timing, size: \
+  print('{}: {:.3f}s'.format(name, timing) + (', {:.1f} MB/s'.format(size / timing / 1024 / 1024) if size else '')) or \
+  True
@@ -43,6 +43,24 @@ def handle_exceptions(function):
 def test_app_worker(app):
   return test_app(app)
 
+def test_package_contents():
+  import contextlib
+  import gzip
+  import shutil
+  import tempfile
+  path = tempfile.mkdtemp()
+  try:
+    with open(get_package_contents_fixture_path(), 'rb') as file, contextlib.closing(gzip.open(os.path.join(path, 'Contents-amd64.gz'), 'wb')) as gzip_file:
+      shutil.copyfileobj(file, gzip_file)
+    tuxapp.connect_data(os.path.join(path, 'packages')).executemany('REPLACE INTO packages (name, url) VALUES (?, ?)', ((package, '') for package in get_package_contents_fixture_packages()))
+    tuxapp.update_package_library_items(os.path.join(path, 'packages'), tuxapp.read_package_contents_library_items(os.path.join(path, 'Contents-amd64.gz'), 'x86_64-linux-gnu'))
+    libraries = dict(tuxapp.connect_data(os.path.join(path, 'packages')).execute('SELECT library, package FROM libraries'))
+    if libraries != get_package_contents_fixture_libraries():
+      raise AssertionError('Unexpected libraries from {}: {}'.format(get_package_contents_fixture_path(), sorted(libraries.items())))
+    return True
+  finally:
+    shutil.rmtree(path)
+
 build_app_readonly_bind_paths = lambda app=None: \
   tuple(path for pattern in (
     '/usr/lib/*-linux-gnu/alsa-lib',
@@ -182,6 +200,34 @@ get_distributions = lambda: tuple(sorted(get_test_distributions()))
 
 get_install_flag_path = lambda distribution: tuxapp.get_app_root_file_path(distribution, os.path.join('var/lib', tuxapp.get_name()))
 
+get_package_contents_fixture_libraries = lambda: {
+  'libc.so.6': 'libc6',
+  'libfreebl3.so': 'libnss3',
+  'libnss3.so': 'libnss3',
+  'libpulse.so.0': 'libpulse0',
+  'libpulse.so.0.24.2': 'libpulse0',
+  'libpulsecommon-16.1.so': 'libpulse0',
+  'libsamba-util.so.0': 'libsmbclient',
+  'libsoftokn3.so': 'libnss3',
+  'libuno_sal.so.3': 'libuno-sal3',
+  'radeonsi_dri.so': 'libgl1-mesa-dri',
+}
+
+get_package_contents_fixture_packages = lambda: (
+  'libc6',
+  'libgl1-mesa-dri',
+  'libnss3',
+  'libpulse-dev',
+  'libpulse0',
+  'libreoffice-core',
+  'libsmbclient',
+  'libuno-sal3',
+  'openjdk-17-jre-headless',
+  'samba-libs',
+)
+
+get_package_contents_fixture_path = lambda: os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures/Contents-amd64')
+
 get_process_timeout = lambda: 3
 
 get_test_distributions = lambda: \
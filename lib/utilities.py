@@ -11,10 +11,7 @@ from lib import (
 
 @tuxapp.silence
 def call_parallel(function, iterable, number=10):
-  import contextlib
-  import multiprocessing
-  with contextlib.closing(multiprocessing.Pool(number)) as pool:
-    return functools.reduce(lambda result, process_result: result and process_result, pool.imap_unordered(functools.partial(call_parallel_worker, function), iterable), True)
+  return tuxapp.call_parallel(functools.partial(call_parallel_worker, function), iterable, number)
 
 def call_parallel_worker(function, item):
   try: